@@ -1,20 +1,75 @@
 import sys
-from shutil import which
-from typing import Optional
+from typing import Callable, Optional
 
 from whines_crossfiledialog.exceptions import NoImplementationFoundException
-from whines_crossfiledialog.utils import BaseFileDialog
+from whines_crossfiledialog.utils import BaseFileDialog, which_cached
 
 # Global variable to store picker preferences
 default_picker_preferences = ["kdialog", "pygobject", "qt", "zenity"]
 
 
-def file_dialog(picker_preference: Optional[list[str]] = None) -> type[BaseFileDialog]:  # noqa: C901
+def _load_kdialog() -> type[BaseFileDialog]:
+    from whines_crossfiledialog.file_pickers.kdialog import FileDialog
+
+    return FileDialog
+
+
+def _load_pygobject() -> type[BaseFileDialog]:
+    from whines_crossfiledialog.file_pickers.pygobject import FileDialog
+
+    return FileDialog
+
+
+def _load_qt() -> type[BaseFileDialog]:
+    from whines_crossfiledialog.file_pickers.qt import FileDialog
+
+    return FileDialog
+
+
+def _load_zenity() -> type[BaseFileDialog]:
+    from whines_crossfiledialog.file_pickers.zenity import FileDialog
+
+    return FileDialog
+
+
+# Picker name to loader, imports are deferred until a picker is chosen
+_LOADERS: dict[str, Callable[[], type[BaseFileDialog]]] = {
+    "kdialog": _load_kdialog,
+    "pygobject": _load_pygobject,
+    "qt": _load_qt,
+    "zenity": _load_zenity,
+}
+
+
+def _load_win32() -> type[BaseFileDialog]:
+    from whines_crossfiledialog.file_pickers.win32 import FileDialog
+
+    return FileDialog
+
+
+def _available(picker: str) -> bool:
+    """Binary-backed pickers are only available when their binary is on `$PATH`."""
+    return picker not in _BINARIES or _BINARIES[picker] is not None
+
+
+# The platform is decided once at import, so `file_dialog` does not inspect
+# `sys.platform` on every call
+_PLATFORM = sys.platform
+_IS_LINUX = _PLATFORM == "linux"
+_IS_WIN32 = _PLATFORM == "win32"
+
+# Paths of the binary-backed pickers, only resolved on Linux where they are used
+_BINARIES: dict[str, Optional[str]] = {}
+if _IS_LINUX:
+    _BINARIES = {"kdialog": which_cached("kdialog"), "zenity": which_cached("zenity")}
+
+
+def file_dialog(picker_preference: Optional[list[str]] = None) -> type[BaseFileDialog]:
     """
     From a list of (optional) file picker preferences, return the first available implementation. 
 
     Args:
-    - picker_preference (`Optional[list[str]]`, optional): Order of precedence for picking the file picker implementations. Defaults to `None`.
+    - picker_preference (`Optional[list[str]]`, optional): Order of precedence for picking the file picker implementations. Only used on Linux. Defaults to `None`.
 
     Raises:
     - `NoImplementationFoundException`: Raise when no implementation is found from the list of preferences
@@ -24,10 +79,7 @@ def file_dialog(picker_preference: Optional[list[str]] = None) -> type[BaseFileD
     `BaseFileDialog`: File picker class.
 
     """
-    if sys.platform == "linux":
-        kdialog_binary = which("kdialog")
-        zenity_binary = which("zenity")
-
+    if _IS_LINUX:
         # Get preferences
         preferred_picklers = (
             picker_preference if picker_preference else default_picker_preferences
@@ -35,42 +87,13 @@ def file_dialog(picker_preference: Optional[list[str]] = None) -> type[BaseFileD
 
         # Import pickers based on preferences
         for picker in preferred_picklers:
-            if picker == "kdialog" and kdialog_binary:
-                from whines_crossfiledialog.file_pickers.kdialog import (  # type: ignore[assignment]
-                    FileDialog,
-                )
-
-                return FileDialog
-
-            if picker == "pygobject":
-                from whines_crossfiledialog.file_pickers.pygobject import (  # type: ignore[assignment]
-                    FileDialog,
-                )
-
-                return FileDialog
-
-            if picker == "qt":
-                from whines_crossfiledialog.file_pickers.qt import (  # type: ignore[assignment]
-                    FileDialog,
-                )
-
-                return FileDialog
-
-            if picker == "zenity" and zenity_binary:
-                from whines_crossfiledialog.file_pickers.zenity import (  # type: ignore[assignment]
-                    FileDialog,
-                )
-
-                return FileDialog
+            loader = _LOADERS.get(picker)
+            if loader and _available(picker):
+                return loader()
 
         raise NoImplementationFoundException
 
-    if sys.platform == "win32":
-        print("win32")
-        from whines_crossfiledialog.file_pickers.win32 import (  # type: ignore[assignment]
-            FileDialog,
-        )
-
-        return FileDialog
+    if _IS_WIN32:
+        return _load_win32()
 
     raise NoImplementationFoundException
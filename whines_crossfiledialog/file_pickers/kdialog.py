@@ -1,11 +1,14 @@
 import os
-import sys
-from subprocess import PIPE, Popen
+from subprocess import PIPE, run
 from typing import Optional
 
 from whines_crossfiledialog import strings
 from whines_crossfiledialog.exceptions import FileDialogException
-from whines_crossfiledialog.utils import BaseFileDialog, filter_processor
+from whines_crossfiledialog.utils import (
+    BaseFileDialog,
+    filter_processor,
+    which_cached,
+)
 
 
 class KDialogException(FileDialogException):
@@ -14,8 +17,26 @@ class KDialogException(FileDialogException):
 
 last_cwd: Optional[str] = None
 
+# Command line flags used by the dialogs below, built once instead of per call
+_FLAGS = {
+    "title": "--title",
+    "multiple": "--multiple",
+    "separate-output": "--separate-output",
+    "getopenfilename": "--getopenfilename",
+    "getsavefilename": "--getsavefilename",
+    "getexistingdirectory": "--getexistingdirectory",
+}
 
-def get_preferred_cwd():
+# Filter format understood by kdialog: `Name (*.a *.b) | *.c`
+_FILTER_FORMAT = (" ", "{} ({})")
+_FILTER_SEPARATOR = " | "
+
+
+def get_kdialog_binary() -> str:
+    return which_cached("kdialog") or "kdialog"
+
+
+def get_preferred_cwd() -> Optional[str]:
     possible_cwd = os.environ.get("FILEDIALOG_CWD", "")
     if possible_cwd:
         return possible_cwd
@@ -24,6 +45,15 @@ def get_preferred_cwd():
     if last_cwd:
         return last_cwd
 
+    return None
+
+
+def get_close_fds() -> bool:
+    # File descriptors opened by Python are non-inheritable by default, so kdialog can
+    # skip the descriptor-closing pass before exec. Set `FILEDIALOG_CLOSE_FDS` to `1`,
+    # `true` or `yes` to opt back into it.
+    return os.environ.get("FILEDIALOG_CLOSE_FDS", "").lower() in {"1", "true", "yes"}
+
 
 def set_last_cwd(cwd):
     global last_cwd
@@ -31,35 +61,37 @@ def set_last_cwd(cwd):
 
 
 def run_kdialog(*args, **kwargs) -> str:  # noqa: C901
-    cmdlist = ["kdialog"]
-    cmdlist.extend("--{}".format(arg) for arg in args)
+    # An absolute executable path (along with `close_fds=False` and no `cwd`) lets
+    # `subprocess` launch kdialog through `os.posix_spawn` instead of `fork`
+    cmdlist = [get_kdialog_binary()]
+    cmdlist.extend(_FLAGS.get(arg) or "--" + arg for arg in args)
 
-    if "start_dir" in kwargs:
-        cmdlist.append(kwargs.pop("start_dir"))
+    # The preferred directory is handed to kdialog as its start directory rather than
+    # as `cwd`, which would rule out the `os.posix_spawn` path
+    start_dir = kwargs.pop("start_dir", None) or get_preferred_cwd()
+    if start_dir:
+        cmdlist.append(start_dir)
 
     if "filter" in kwargs:
         cmdlist.append(kwargs.pop("filter"))
 
     for k, v in kwargs.items():
-        cmdlist.append("--{}".format(k))
+        cmdlist.append(_FLAGS.get(k) or "--" + k)
         cmdlist.append(v)
 
-    extra_kwargs = {}
-    preferred_cwd = get_preferred_cwd()
-    if preferred_cwd:
-        extra_kwargs["cwd"] = preferred_cwd
-
-    process = Popen(cmdlist, stdout=PIPE, stderr=PIPE, **extra_kwargs)  # noqa: S603
-    stdout, stderr = process.communicate()
+    process = run(  # noqa: S603
+        cmdlist,
+        stdout=PIPE,
+        check=False,
+        encoding="utf-8",
+        errors="surrogateescape",
+        close_fds=get_close_fds(),
+    )
 
     if process.returncode == -1:
         raise KDialogException("Unexpected error during kdialog call")
 
-    stdout, stderr = stdout.decode(), stderr.decode()  # type: ignore
-    if stderr.strip():
-        sys.stderr.write(stderr)
-
-    return stdout.strip()  # type: ignore[no-any-return]
+    return process.stdout.strip()
 
 
 class FileDialog(BaseFileDialog):
@@ -96,7 +128,11 @@ class FileDialog(BaseFileDialog):
             kdialog_kwargs["start_dir"] = start_dir
 
         if filter:
-            kdialog_kwargs["filter"] = filter_processor(filter, (" ", "{} ({})"), " | ")
+            kdialog_kwargs["filter"] = filter_processor(
+                filter,
+                _FILTER_FORMAT,
+                _FILTER_SEPARATOR,
+            )
 
         result = run_kdialog("getopenfilename", **kdialog_kwargs)
         if result:
@@ -136,7 +172,11 @@ class FileDialog(BaseFileDialog):
             kdialog_kwargs["start_dir"] = start_dir
 
         if filter:
-            kdialog_kwargs["filter"] = filter_processor(filter, (" ", "{} ({})"), " | ")
+            kdialog_kwargs["filter"] = filter_processor(
+                filter,
+                _FILTER_FORMAT,
+                _FILTER_SEPARATOR,
+            )
 
         result = run_kdialog(
             "getopenfilename",
@@ -145,7 +185,7 @@ class FileDialog(BaseFileDialog):
             **kdialog_kwargs,
         )
 
-        result_list = list(map(str.strip, result.split("\n")))
+        result_list = result.split("\n") if result else []
         if result_list:
             set_last_cwd(result_list[0])
             return result_list
@@ -1,3 +1,5 @@
+from functools import cache
+from shutil import which
 from typing import Literal, Optional, overload
 
 from whines_crossfiledialog import strings
@@ -103,6 +105,23 @@ class BaseFileDialog:
         raise NotImplementedError
 
 
+@cache
+def which_cached(name: str) -> Optional[str]:
+    """
+    Resolve the path of an executable once, and reuse the result for every later
+    lookup of the same name.
+
+    Args:
+    - name (`str`): The name of the executable.
+
+    Returns:
+    `Optional[str]`: The path of the executable, or `None` if it is not on `$PATH`.
+
+    """
+
+    return which(name)
+
+
 @overload
 def filter_item_preprocessor(
     item: str | list[str],